@@ -1,4 +1,23 @@
-from .plots import *
+from importlib import import_module as _import_module
+
+from . import plots
+from .plots import hist, lm, model_recovery, scatter, violin
 from .utilities import utilities
 from .utilities import annotation
-from .stats import *
\ No newline at end of file
+
+__all__ = plots.__all__ + ["bms", "plots", "stats", "utilities", "annotation"]
+
+
+def __getattr__(name):
+    # Resolve heavy plots and the pymc3-based stats only when accessed
+    if name in plots.__all__:
+        return getattr(plots, name)
+    if name == "stats":
+        return _import_module(".stats", __name__)
+    if name == "bms":
+        return _import_module(".stats", __name__).bms
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
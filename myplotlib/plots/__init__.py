@@ -1,4 +1,5 @@
-from .factorial import factorial_heatmap
+from importlib import import_module
+
 from .hist import hist
 from .lm import lm
 from .model_recovery import model_recovery
@@ -6,3 +7,19 @@ from .scatter import scatter
 from .violin import violin
 
 __all__ = ["violin", "scatter", "lm", "hist", "factorial_heatmap", "model_recovery"]
+
+# Plots with heavy dependencies (pandas) are imported on first use
+_LAZY = {"factorial_heatmap": "factorial"}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        value = getattr(import_module(f".{_LAZY[name]}", __name__), name)
+        # Cache on the package, so later lookups skip __getattr__
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
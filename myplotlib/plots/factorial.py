@@ -1,7 +1,28 @@
 import matplotlib.pyplot as plt
 import pandas as pd
 import numpy as np
-from itertools import groupby
+from matplotlib.collections import LineCollection
+from matplotlib.text import Text
+
+
+def _runlength(levels):
+    """Identify blocks of identical consecutive levels.
+
+    Parameters
+    ----------
+    levels : array like
+        Sequence of levels
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        First and last (inclusive) index of each block
+    """
+    levels = np.asarray(levels)
+    change = np.flatnonzero(levels[1:] != levels[:-1]) + 1
+    starts = np.concatenate([[0], change])
+    ends = np.concatenate([change, [levels.size]]) - 1
+    return starts, ends
 
 
 def factorial_heatmap(
@@ -46,11 +67,20 @@ def factorial_heatmap(
         axis with plot
     """
     all_factors = row_factors + col_factors
+    # Integer level codes and sorted levels, computed once per factor.
+    # Only levels present in df count, also for filtered categorical columns
+    codes = {}
+    levels = {}
+    for factor in all_factors:
+        categorical = pd.Categorical(df[factor]).remove_unused_categories()
+        codes[factor] = categorical.codes
+        levels[factor] = np.asarray(categorical.categories)
+
     default_factor_labels = {factor: factor for factor in all_factors}
     factor_labels = {**default_factor_labels, **factor_labels}
     default_level_labels = {
         factor_labels[factor]: {
-            level: f"{factor_labels[factor]}={level}" for level in df[factor].unique()
+            level: f"{factor_labels[factor]}={level}" for level in levels[factor]
         }
         for factor in all_factors
     }
@@ -59,11 +89,13 @@ def factorial_heatmap(
     if ax is None:
         ax = plt.gca()
 
-    n_row = np.prod([df[row_factor].unique().size for row_factor in row_factors])
-    n_col = np.prod([df[col_factor].unique().size for col_factor in col_factors])
+    n_row = np.prod([levels[row_factor].size for row_factor in row_factors])
+    n_col = np.prod([levels[col_factor].size for col_factor in col_factors])
 
-    df_sorted = df.sort_values(row_factors + col_factors)
-    values = df_sorted[value_var].values.reshape(n_row, n_col)
+    # Sort on integer codes, with the first factor varying slowest
+    order = np.lexsort([codes[factor] for factor in reversed(all_factors)])
+    values = df[value_var].values[order].reshape(n_row, n_col)
+    sorted_codes = {factor: codes[factor][order] for factor in all_factors}
 
     # Make the heatmap
     im = plt.imshow(values, cmap=cmap)
@@ -71,75 +103,87 @@ def factorial_heatmap(
     # x_labels = levels from last col_factor
     ax.set_xlabel(factor_labels[col_factors[-1]])
     ax.set_xticks(np.arange(n_col))
-    ax.set_xticklabels(df_sorted[col_factors[-1]][:n_col], rotation=xlabel_rotation)
+    ax.set_xticklabels(
+        levels[col_factors[-1]][sorted_codes[col_factors[-1]][:n_col]],
+        rotation=xlabel_rotation,
+    )
     ax.set_xlim(-0.5, n_col - 0.5)
 
     # other factors across columns:
     # from second-to-last to first, so that the first factor is the uppermost level
+    bars = []
     for f, col_factor in enumerate(col_factors[-2::-1]):
-        levels = df_sorted[col_factor].values[:n_col]
+        level_codes = sorted_codes[col_factor][:n_col]
         bar_y = n_row - 0.25 + f * pad_per_factor
 
-        # Identify blocks of same levels: https://stackoverflow.com/a/6352456
-        index = 0
-        for level, block in groupby(levels):
-            length = sum(1 for i in block)
-            bar_xmin = index
-            bar_xmax = index + length - 1
-            index += length
-            ax.plot(
-                [bar_xmin - 0.4, bar_xmax + 0.4],
-                [bar_y, bar_y],
-                linewidth=0.75,
-                color="k",
-                clip_on=False,
-            )
-            ax.annotate(
-                level_labels[factor_labels[col_factor]][level],
-                xy=(bar_xmin + (bar_xmax - bar_xmin) / 2, bar_y + pad_label_bar),
-                xycoords="data",
-                ha="center",
-                va="bottom",
-                ma="center",
-                annotation_clip=False,
+        starts, ends = _runlength(level_codes)
+        segments = np.full((starts.size, 2, 2), bar_y, dtype=float)
+        segments[:, 0, 0] = starts - 0.4
+        segments[:, 1, 0] = ends + 0.4
+        bars.append(segments)
+        for bar_xmin, bar_xmax in zip(starts, ends):
+            ax.add_artist(
+                Text(
+                    x=bar_xmin + (bar_xmax - bar_xmin) / 2,
+                    y=bar_y + pad_label_bar,
+                    text=level_labels[factor_labels[col_factor]][
+                        levels[col_factor][level_codes[bar_xmin]]
+                    ],
+                    ha="center",
+                    va="bottom",
+                    ma="center",
+                    clip_on=False,
+                )
             )
 
     # y_labels = levels from last row_factor
     ax.set_ylabel(factor_labels[row_factors[-1]])
     ax.set_yticks(np.arange(n_row))
-    ax.set_yticklabels(df_sorted[row_factors[-1]][::n_col], rotation=ylabel_rotation)
+    ax.set_yticklabels(
+        levels[row_factors[-1]][sorted_codes[row_factors[-1]][::n_col]],
+        rotation=ylabel_rotation,
+    )
     ax.set_ylim(-0.5, n_row - 0.5)
 
     # other factors across rows:
     # from second-to-last to first, so that the first factor is the uppermost level
     for f, row_factor in enumerate(row_factors[-2::-1]):
-        levels = df_sorted[row_factor].values[::n_col][:n_row]
+        level_codes = sorted_codes[row_factor][::n_col][:n_row]
         bar_x = n_col - 0.25 + f * pad_per_factor
 
-        index = 0
-        for level, block in groupby(levels):
-            length = sum(1 for i in block)
-            bar_ymin = index
-            bar_ymax = index + length - 1
-            index += length
-            ax.plot(
-                [bar_x, bar_x],
-                [bar_ymin - 0.4, bar_ymax + 0.4],
-                linewidth=0.75,
-                color="k",
-                clip_on=False,
-            )
-            ax.annotate(
-                level_labels[factor_labels[row_factor]][level],
-                xy=(bar_x + pad_label_bar, bar_ymin + (bar_ymax - bar_ymin) / 2),
-                xycoords="data",
-                rotation=270,
-                ha="left",
-                va="center",
-                ma="center",
-                annotation_clip=False,
+        starts, ends = _runlength(level_codes)
+        segments = np.full((starts.size, 2, 2), bar_x, dtype=float)
+        segments[:, 0, 1] = starts - 0.4
+        segments[:, 1, 1] = ends + 0.4
+        bars.append(segments)
+        for bar_ymin, bar_ymax in zip(starts, ends):
+            ax.add_artist(
+                Text(
+                    x=bar_x + pad_label_bar,
+                    y=bar_ymin + (bar_ymax - bar_ymin) / 2,
+                    text=level_labels[factor_labels[row_factor]][
+                        levels[row_factor][level_codes[bar_ymin]]
+                    ],
+                    rotation=270,
+                    ha="left",
+                    va="center",
+                    ma="center",
+                    clip_on=False,
+                )
             )
 
+    # Draw all level bars as one collection
+    if bars:
+        ax.add_collection(
+            LineCollection(
+                np.concatenate(bars),
+                linewidths=0.75,
+                colors="k",
+                clip_on=False,
+            ),
+            autolim=False,
+        )
+
     # colorbar legend
     cb = plt.colorbar(im, pad=len(row_factors) * pad_colorbar)
     cb.ax.set_title(value_var)
@@ -1,13 +1,44 @@
 # /usr/bin/python
 
+from functools import lru_cache
+
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-import pymc3 as pm
+from matplotlib.patches import Polygon
+from scipy import stats
 
 from myplotlib.plots.scatter import scatter
 
 
+def _ols(x, y):
+    """Closed-form ordinary least squares fit of y on x with intercept.
+
+    Args:
+        x (numpy.ndarray): x values
+        y (numpy.ndarray): y values
+
+    Returns:
+        tuple: intercept, slope, residual variance, mean of x and sum of squares of x
+    """
+    n = x.size
+    xbar = x.mean()
+    ybar = y.mean()
+    dx = x - xbar
+    Sxx = dx @ dx
+    beta = dx @ (y - ybar) / Sxx
+    intercept = ybar - beta * xbar
+    residuals = y - (intercept + beta * x)
+    sigma2 = residuals @ residuals / (n - 2)
+    return intercept, beta, sigma2, xbar, Sxx
+
+
+@lru_cache(maxsize=16)
+def _tcrit(credible_interval, df):
+    """Two-sided critical value of Student's t distribution, cached per (interval, df)."""
+    return stats.t.ppf(1 - (1 - credible_interval) / 2, df)
+
+
 def lm(
     x,
     y,
@@ -23,7 +54,8 @@ def lm(
     Args:
         x (array like): x values
         y (array like): y values
-        trace (pymc3.MultiTrace, optional): GLM trace from PyMC3.
+        trace (pymc3.MultiTrace, optional): GLM trace from PyMC3. If given, the band shows the posterior credible interval. Defaults to None, fitting an OLS model with an analytic confidence band.
+        credible_interval (float, optional): Width of the credible (or confidence) band. Defaults to 0.95.
         ax (matplotlib.axis, optional): Axis to plot on. Defaults to current axis.
         bandalpha (float, optional): Opacity level of confidence band.
         scatter_kws (dict, optional): Dictionary of keyword arguments passed onto `scatter`.
@@ -31,47 +63,78 @@ def lm(
 
     Returns:
         matplotlib.axis: Axis with the linear model plot.
+        pymc3.MultiTrace: The trace that was passed in (None for the OLS fit).
+        pandas.DataFrame: Summary with "mean" estimates of "Intercept" and "x".
     """
+    x = np.ascontiguousarray(x, dtype=np.float64)
+    y = np.ascontiguousarray(y, dtype=np.float64)
+
     if ax is None:
         ax = plt.gca()
 
     # Determine color (this is necessary so that the scatter and the line have the same color)
-    color = next(ax._get_lines.prop_cycler)["color"]
+    color = ax._get_lines.get_next_color()
 
     # Scatter
-
-    print(scatter)
     ax = scatter(x, y, color=color, ax=ax, **scatter_kws)
 
-    # Run GLM in PyMC3
+    xs = np.linspace(np.min(x), np.max(x), 100)
+
     if trace is None:
-        df = pd.DataFrame(dict(x=x, y=y))
-        with pm.Model() as glm:
-            pm.GLM.from_formula("y ~ x", data=df)
-            trace = pm.sample()
+        n = x.size
+        intercept, beta, sigma2, xbar, Sxx = _ols(x, y)
+        yfit = intercept + beta * xs
 
-    summary = pm.summary(trace)
+        # Analytic confidence band of the mean, centered on the fitted line
+        tcrit = _tcrit(credible_interval, n - 2)
+        half_width = tcrit * np.sqrt(sigma2 * (1 / n + (xs - xbar) ** 2 / Sxx))
+        ypred_lower = yfit - half_width
+        ypred_upper = yfit + half_width
+    else:
+        intercept_samples = trace.get_values("Intercept")
+        beta_samples = trace.get_values("x")
+        intercept = intercept_samples.mean()
+        beta = beta_samples.mean()
+        yfit = intercept + beta * xs
 
-    # Plot MAP regression line
-    xs = np.linspace(np.min(x), np.max(x), 100)
-    intercept = summary.loc["Intercept", "mean"]
-    beta = summary.loc["x", "mean"]
-    ax.plot(xs, intercept + beta * xs, color=color, zorder=4, **kwargs)
-
-    # Plot posterior predictive credible region band
-    intercept_samples = trace.get_values("Intercept")
-    beta_samples = trace.get_values("x")
-    ypred = intercept_samples + beta_samples * xs[:, None]
-    ypred_lower = np.quantile(ypred, (1 - credible_interval) / 2, axis=1)
-    ypred_upper = np.quantile(ypred, 1 - (1 - credible_interval) / 2, axis=1)
-    ax.fill_between(
-        xs,
-        ypred_lower,
-        ypred_upper,
-        color=color,
-        zorder=1,
-        alpha=bandalpha,
-        linewidth=0,
+        # Posterior predictive credible region, in a single buffer
+        ypred = np.empty((xs.size, beta_samples.size))
+        np.multiply(beta_samples[None, :], xs[:, None], out=ypred)
+        np.add(ypred, intercept_samples[None, :], out=ypred)
+
+        # Partial sort to the ranks around both quantiles instead of a full sort,
+        # then interpolate between neighbouring ranks as np.quantile does
+        n_samples = ypred.shape[1]
+        ranks = np.array(
+            [(1 - credible_interval) / 2, 1 - (1 - credible_interval) / 2]
+        ) * (n_samples - 1)
+        k = np.floor(ranks).astype(int)
+        k_next = np.minimum(k + 1, n_samples - 1)
+        ypred.partition(np.unique(np.concatenate([k, k_next])), axis=1)
+        ypred_lower, ypred_upper = (
+            ypred[:, k] + (ranks - k) * (ypred[:, k_next] - ypred[:, k])
+        ).T
+
+    summary = pd.DataFrame({"mean": [intercept, beta]}, index=["Intercept", "x"])
+
+    # Plot regression line
+    ax.plot(xs, yfit, color=color, zorder=4, **kwargs)
+
+    # Plot credible / confidence band as one closed polygon
+    verts = np.empty((2 * xs.size, 2))
+    verts[: xs.size, 0] = xs
+    verts[: xs.size, 1] = ypred_lower
+    verts[xs.size :, 0] = xs[::-1]
+    verts[xs.size :, 1] = ypred_upper[::-1]
+    ax.add_patch(
+        Polygon(
+            verts,
+            closed=True,
+            facecolor=color,
+            zorder=1,
+            alpha=bandalpha,
+            linewidth=0,
+        )
     )
 
     return ax, trace, summary
@@ -40,24 +40,25 @@ def model_recovery(
     if ax is None:
         ax = plt.gca()
 
+    mpp = np.asarray(mpp)
+    xp = np.asarray(xp)
+
     # Plot heatmap
     ax.matshow(mpp, cmap=cmap, vmin=0, vmax=1)
     ax.xaxis.set_ticks_position("bottom")
     ax.tick_params(axis="both", which="both", length=0)  # Hide ticks
 
     ## Add heatmap values
-    for (i, j), z in np.ndenumerate(mpp):
-        if z < fontcolor_threshold:
-            color = color_belowthresh
-        else:
-            color = color_abovethresh
+    labels = np.char.mod(f"%.{round_main_values}f", mpp)
+    below = mpp < fontcolor_threshold
+    for (i, j), label in np.ndenumerate(labels):
         ax.text(
             j,
             i,
-            "{0:0.{prec}f}".format(z, prec=round_main_values),
+            label,
             ha="center",
             va="center",
-            color=color,
+            color=color_belowthresh if below[i, j] else color_abovethresh,
             fontsize=fontsize_main,
         )
 
@@ -66,18 +67,16 @@ def model_recovery(
     ax_inset.matshow(xp, cmap=cmap, vmin=0, vmax=1, aspect=inset_aspect)
 
     ## Add heatmap values
-    for (i, j), z in np.ndenumerate(xp):
-        if z < fontcolor_threshold:
-            color = color_belowthresh
-        else:
-            color = color_abovethresh
+    labels = np.char.mod(f"%.{round_inset_values}f", xp)
+    below = xp < fontcolor_threshold
+    for (i, j), label in np.ndenumerate(labels):
         ax_inset.text(
             j,
             i,
-            "{0:0.{prec}f}".format(z, prec=round_inset_values),
+            label,
             ha="center",
             va="center",
-            color=color,
+            color=color_belowthresh if below[i, j] else color_abovethresh,
             fontsize=fontsize_inset,
         )
 
@@ -30,7 +30,7 @@ def scatter(
         ax = plt.gca()
 
     if color is None:
-        color = next(ax._get_lines.prop_cycler)["color"]
+        color = ax._get_lines.get_next_color()
 
     # Solid outlines and translucent faces
     scatterArtists = ax.plot(
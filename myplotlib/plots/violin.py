@@ -1,8 +1,75 @@
 # /usr/bin/python
 
+import matplotlib
 import matplotlib.pyplot as plt
-import pandas as pd
-from seaborn import violinplot
+import numpy as np
+from matplotlib.colors import ListedColormap
+
+# Above this many observations, densities are smoothed from a binned histogram
+_BINNED_THRESHOLD = 10000
+_N_BINS = 1024
+
+
+def _kde(values, grid, bandwidth):
+    """Gaussian kernel density estimate of `values`, evaluated on `grid`.
+
+    Args:
+        values (numpy.ndarray): Finite observations.
+        grid (numpy.ndarray): Points to evaluate the density at.
+        bandwidth (float): Standard deviation of the Gaussian kernel.
+
+    Returns:
+        numpy.ndarray: Density at each grid point. Exact for up to `_BINNED_THRESHOLD` observations, binned beyond.
+    """
+    norm = values.size * bandwidth * np.sqrt(2 * np.pi)
+    if values.size <= _BINNED_THRESHOLD:
+        z = (grid[:, None] - values[None, :]) / bandwidth
+        return np.exp(-0.5 * z ** 2).sum(axis=1) / norm
+
+    # Linear binning onto a fine grid over the same range, then one convolution
+    # with the kernel, so memory does not grow with the number of observations
+    bins = np.linspace(grid[0], grid[-1], _N_BINS)
+    step = bins[1] - bins[0]
+    position = (values - bins[0]) / step
+    left = np.clip(np.floor(position).astype(np.intp), 0, _N_BINS - 2)
+    weight = position - left
+    counts = np.bincount(left, 1 - weight, _N_BINS) + np.bincount(
+        left + 1, weight, _N_BINS
+    )
+    offsets = np.arange(1 - _N_BINS, _N_BINS) * step
+    kernel = np.exp(-0.5 * (offsets / bandwidth) ** 2)
+    density = np.convolve(counts, kernel, mode="valid")
+    return np.interp(grid, bins, density) / norm
+
+
+def _palette_colors(palette, columns):
+    """Resolve a violin palette to one color per column.
+
+    Args:
+        palette (list, dict, str or None): List of colors, dict mapping column names to colors, or matplotlib colormap name. None uses the axes color cycle.
+        columns (pandas.Index): Columns to color.
+
+    Returns:
+        list: One color per column.
+    """
+    if palette is None:
+        palette = plt.rcParams["axes.prop_cycle"].by_key()["color"]
+    elif isinstance(palette, dict):
+        return [palette[column] for column in columns]
+    elif isinstance(palette, str):
+        try:
+            cmap = matplotlib.colormaps[palette]
+        except KeyError:
+            raise ValueError(
+                f"palette {palette!r} is not a matplotlib colormap name"
+            ) from None
+        if isinstance(cmap, ListedColormap) and cmap.N <= 20:
+            # Qualitative colormaps, like "Set2" or "tab10", are cycled through
+            palette = list(cmap.colors)
+        else:
+            # Continuous colormaps are sampled evenly, leaving out both ends
+            palette = list(cmap(np.linspace(0, 1, len(columns) + 2)[1:-1]))
+    return [palette[i % len(palette)] for i in range(len(columns))]
 
 
 def violin(
@@ -12,9 +79,10 @@ def violin(
 
     Args:
         data (pandas.DataFrame): Data to plot. Each column will be made into one violin.
+        value_name (str, optional): Label of the value axis. Defaults to "value".
         violin_width (float, optional): Width of the violins. Defaults to 0.8.
         box_width (float, optional): Width of the boxplot. Defaults to 0.1.
-        palette (list, optional): list of colors to use for violins. Defaults to default colors.
+        palette (list, dict or str, optional): list of colors to use for violins, dict mapping column names to colors, or matplotlib colormap name. Defaults to default colors.
         ax (matplotlib.axis, optional): Axis to plot on. Defaults to None.
 
     Returns:
@@ -23,35 +91,79 @@ def violin(
     if ax is None:
         ax = plt.gca()
 
-    # transform data into long format for seaborn violinplot
-    if data.columns.name is None:
-        data.columns.name = "variable"
-    data_long = pd.melt(data, value_name=value_name)
-
-    # Violinplot
-    violinplot(
-        x=data.columns.name,
-        y=value_name,
-        data=data_long,
-        palette=palette,
-        linewidth=0,
-        inner=None,
-        scale="width",
-        width=violin_width,
-        saturation=1,
-        ax=ax,
-    )
+    # Only numeric columns can be drawn
+    data = data.select_dtypes("number")
+
+    var_name = "variable" if data.columns.name is None else data.columns.name
+    colors = _palette_colors(palette, data.columns)
+
+    # All columns as one float (n_samples, n_columns) array, computed once.
+    # Missing and non-finite values become NaN and are skipped below
+    samples = data.to_numpy(dtype=np.float64, na_value=np.nan)
+    finite = np.isfinite(samples)
+    samples = np.where(finite, samples, np.nan)
+
+    # Build all artists without autoscaling, and scale the view once at the end
+    autoscale_y = ax.get_autoscaley_on()
+    ax.set_autoscale_on(False)
+
+    # Violins, one kernel density estimate (Scott's rule) per column on its own grid,
+    # cut two bandwidths beyond the data and scaled to equal width
+    for i, column in enumerate(samples.T):
+        values = column[finite[:, i]]
+        if values.size == 0:
+            continue
+        color = colors[i]
+        if values.size < 2 or values.min() == values.max():
+            # No spread to estimate a density from, mark the value with a line
+            ax.plot(
+                [i - violin_width / 2, i + violin_width / 2],
+                [values[0], values[0]],
+                color=color,
+                linewidth=0.5,
+            )
+            continue
+        bandwidth = values.std(ddof=1) * values.size ** (-1 / 5)
+        grid = np.linspace(
+            values.min() - 2 * bandwidth, values.max() + 2 * bandwidth, 200
+        )
+        density = _kde(values, grid, bandwidth)
+        half_width = violin_width / 2 * density / density.max()
+        ax.fill_betweenx(
+            grid, i - half_width, i + half_width, facecolor=color, linewidth=0
+        )
 
     # Boxplot
-    # Matplotlib boxplot uses a different data format (list of arrays)
-    boxplot_data = [data[var].values for var in data.columns]
+    # Statistics for all columns with data at once, with whiskers at 1.5 IQR like
+    # ax.boxplot. Empty columns get no box, as they get no violin
+    positions = np.flatnonzero(finite.any(axis=0))
+    boxed = samples[:, positions]
+    q1, med, q3 = np.nanquantile(boxed, [0.25, 0.5, 0.75], axis=0)
+    iqr = q3 - q1
+    whislo = np.nanmin(np.where(boxed >= q1 - 1.5 * iqr, boxed, np.nan), axis=0)
+    whishi = np.nanmax(np.where(boxed <= q3 + 1.5 * iqr, boxed, np.nan), axis=0)
+    whislo = np.minimum(whislo, q1)
+    whishi = np.maximum(whishi, q3)
+    bxpstats = [
+        dict(
+            med=med[i],
+            q1=q1[i],
+            q3=q3[i],
+            whislo=whislo[i],
+            whishi=whishi[i],
+            fliers=np.concatenate(
+                [column[column < whislo[i]], column[column > whishi[i]]]
+            ),
+        )
+        for i, column in enumerate(boxed.T)
+    ]
 
-    boxplotArtists = ax.boxplot(
-        boxplot_data,
-        positions=range(len(boxplot_data)),
+    ax.bxp(
+        bxpstats,
+        positions=positions,
         widths=box_width,
         showcaps=False,
-        boxprops=dict(linewidth=0.5),
+        boxprops=dict(linewidth=0.5, facecolor="white"),
         medianprops=dict(linewidth=0.5, color="black"),
         whiskerprops=dict(linewidth=0.5),
         flierprops=dict(
@@ -65,10 +177,16 @@ def violin(
         manage_ticks=False,
         patch_artist=True,
     )
-    for patch in boxplotArtists["boxes"]:
-        patch.set_facecolor("white")
+
+    # Categorical x-axis
+    ax.set_xticks(range(len(data.columns)))
+    ax.set_xticklabels(data.columns)
+    ax.set_xlabel(var_name)
+    ax.set_ylabel(value_name)
 
     # Adjust x-limits
     ax.set_xlim(-0.5, len(data.columns) + -0.5)
+    ax.set_autoscaley_on(autoscale_y)
+    ax.autoscale_view(scalex=False)
 
     return ax
@@ -1,5 +1,8 @@
 #!/usr/bin/python
 import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 
 
 def hTextLine(
@@ -24,7 +27,7 @@ def hTextLine(
     if ax is None:
         ax = plt.gca()
 
-    ax.hlines(y, x0, x1, linewidth=linewidth, clip_on=False)
+    ax.add_line(Line2D([x0, x1], [y, y], linewidth=linewidth, clip_on=False))
     ax.text(
         x=(x0 + x1) / 2,
         y=y + lineTextGap,
@@ -36,3 +39,38 @@ def hTextLine(
     )
     return ax
 
+
+def hTextLines(
+    texts, x0s, x1s, ys, ax=None, linewidth=0.5, lineTextGap=0.1, fontsize=5, **kwargs
+):
+    """Add multiple horizontal lines with text at once, e.g., for a grid of p-values.
+    All lines are drawn as a single LineCollection.
+
+    Args:
+        texts (list): Texts.
+        x0s (array like): Line start values.
+        x1s (array like): Line end values.
+        ys (array like): Heights of the lines.
+        ax (matplotlib.axis, optional): Axis to annotate. Defaults to current axis.
+        linewidth (float, optional): Linewidth. Defaults to 0.5.
+        lineTextGap (float, optional): Distance between the lines and the texts. Defaults to 0.1.
+        fontsize (int, optional): Fontsize. Defaults to 5.
+
+    Returns:
+        matplotlib.axis: Annotated axis.
+    """
+
+    if ax is None:
+        ax = plt.gca()
+
+    x0s = np.asarray(x0s, dtype=float)
+    x1s = np.asarray(x1s, dtype=float)
+    ys = np.asarray(ys, dtype=float)
+    segments = np.column_stack([x0s, ys, x1s, ys]).reshape(-1, 2, 2)
+
+    ax.add_collection(LineCollection(segments, linewidths=linewidth, clip_on=False))
+    for text, x, y in zip(texts, (x0s + x1s) / 2, ys + lineTextGap):
+        ax.text(
+            x=x, y=y, s=text, ha="center", va="bottom", fontsize=fontsize, **kwargs
+        )
+    return ax
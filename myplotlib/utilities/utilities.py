@@ -5,65 +5,74 @@ This script contains plot utilities
 
 import matplotlib
 import matplotlib.pyplot as plt
+import numpy as np
 from matplotlib import cycler
+from matplotlib.colors import to_rgba
 import string
 from itertools import cycle
-from six.moves import zip
 
-
-def set_mpl_defaults(matplotlib):
+# Default color cycle, converted to RGBA once at import
+_PALETTE = [
+    "slategray",
+    "darksalmon",
+    "mediumaquamarine",
+    "indianred",
+    "orchid",
+    "paleturquoise",
+    "tan",
+    "lightpink",
+]
+_PROP_CYCLE = cycler("color", [to_rgba(color) for color in _PALETTE])
+
+# Default plot parameters, built once at import
+_MPL_DEFAULTS = {
+    "font.size": 6,
+    "axes.labelsize": 6,
+    "axes.titlesize": 6,
+    "xtick.labelsize": 6,
+    "ytick.labelsize": 6,
+    "figure.titlesize": 6,
+    "legend.fancybox": True,
+    "legend.fontsize": 6,
+    "legend.handletextpad": 0.25,
+    "legend.handlelength": 1,
+    "legend.labelspacing": 0.7,
+    "legend.columnspacing": 1.5,
+    "legend.edgecolor": (0, 0, 0, 1),  # solid black
+    "patch.linewidth": 0.75,
+    "figure.dpi": 300,
+    "figure.figsize": (2, 2),
+    "lines.linewidth": 1,
+    "axes.linewidth": 0.75,
+    "axes.spines.right": False,
+    "axes.spines.top": False,
+    "axes.prop_cycle": _PROP_CYCLE,
+    "lines.markeredgewidth": 1,
+    "lines.markeredgecolor": "black",
+}
+
+
+def set_mpl_defaults(matplotlib, backend=None):
     """This function updates the matplotlib library to adjust 
     some default plot parameters
 
     Parameters
     ----------
     matplotlib : matplotlib instance
+    backend : str, optional
+        Backend to switch to, by default None (keep the current backend).
+        "Agg" is recommended when only saving figures to PNG/PDF non-interactively.
     
     Returns
     -------
     matplotlib
         matplotlib instance
     """
-    params = {
-        "font.size": 6,
-        "axes.labelsize": 6,
-        "axes.titlesize": 6,
-        "xtick.labelsize": 6,
-        "ytick.labelsize": 6,
-        "figure.titlesize": 6,
-        "legend.fancybox": True,
-        "legend.fontsize": 6,
-        "legend.handletextpad": 0.25,
-        "legend.handlelength": 1,
-        "legend.labelspacing": 0.7,
-        "legend.columnspacing": 1.5,
-        "legend.edgecolor": (0, 0, 0, 1),  # solid black
-        "patch.linewidth": 0.75,
-        "figure.dpi": 300,
-        "figure.figsize": (2, 2),
-        "lines.linewidth": 1,
-        "axes.linewidth": 0.75,
-        "axes.spines.right": False,
-        "axes.spines.top": False,
-        "axes.prop_cycle": cycler(
-            "color",
-            [
-                "slategray",
-                "darksalmon",
-                "mediumaquamarine",
-                "indianred",
-                "orchid",
-                "paleturquoise",
-                "tan",
-                "lightpink",
-            ],
-        ),
-        "lines.markeredgewidth": 1,
-        "lines.markeredgecolor": "black",
-    }
+    if backend is not None:
+        matplotlib.use(backend, force=True)
 
     # Update parameters
-    matplotlib.rcParams.update(params)
+    matplotlib.rcParams.update(_MPL_DEFAULTS)
 
     return matplotlib
 
@@ -86,9 +95,8 @@ def cm2inch(*tupl):
     """
     inch = 2.54
     if isinstance(tupl[0], tuple):
-        return tuple(i / inch for i in tupl[0])
-    else:
-        return tuple(i / inch for i in tupl)
+        tupl = tupl[0]
+    return tuple((np.asarray(tupl, dtype=float) / inch).tolist())
 
 
 def label_axes(fig, labels=None, loc=None, **kwargs):